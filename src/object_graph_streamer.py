@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
 import typing
+import io
+from collections.abc import Iterator, Mapping, Sequence
 from enum import Enum
 
 import json
@@ -220,8 +222,12 @@ class ObjectGraphStreamerProps:
     paths: typing.Optional[typing.List[str]] = None
     objectProcessor: typing.Optional[typing.Callable[[
         typing.List[str]], typing.List[str]]] = None
+    # arrayProcessor receives the original list for list inputs and an
+    # iterator for any other array (tuple, range, generator, cursor). The
+    # result is consumed lazily, so filters stream in constant memory;
+    # sorting processors for non-list inputs should use sorted(a)
     arrayProcessor:  typing.Optional[typing.Callable[[
-        typing.List[any]], typing.List[any]]] = None
+        typing.Union[typing.List[any], typing.Iterator[any]]], typing.Iterable[any]]] = None
     valFactory: typing.Optional[typing.Callable[[any], ValType]] = None
 
     def assignPath(self, paths: typing.List[str]):
@@ -254,18 +260,29 @@ def defaultObjectGraphStreamerProps(ogsp: typing.Optional[ObjectGraphStreamerPro
     return ogsp
 
 
+def isArray(e: any) -> bool:
+    # sequences and iterators (generators, cursors) stream as arrays;
+    # strings, byte buffers and file objects stream as plain values
+    if isinstance(e, (str, bytes, bytearray, memoryview, io.IOBase)):
+        return False
+    return isinstance(e, (Sequence, Iterator))
+
+
 def objectGraphStreamer(e: any, out: typing.Callable[[SVal], None], pogsp: typing.Optional[ObjectGraphStreamerProps] = None):
     ogsp = defaultObjectGraphStreamerProps(pogsp)
-    if isinstance(e, list):
+    if isArray(e):
+        # e may be a generator or cursor: consume it lazily via the
+        # arrayProcessor and derive the index path per element
         arrayPaths = ogsp.paths + ["["]
         out(SVal(**{'outState': OutState.ARRAY_START, 'paths': arrayPaths}))
-        for idx, i in enumerate(ogsp.arrayProcessor(e)):
+        items = e if isinstance(e, list) else iter(e)
+        for idx, i in enumerate(ogsp.arrayProcessor(items)):
             objectGraphStreamer(
                 i, out, ogsp.assignPath(arrayPaths + [f"{idx}"]))
         out(SVal(**{'outState': OutState.ARRAY_END,
             'paths': ogsp.paths + [']']}))
         return
-    elif isinstance(e, dict):
+    elif isinstance(e, Mapping):
         attrPath = ogsp.paths + ['{']
         out(SVal(**{'outState': OutState.OBJECT_START, 'paths': attrPath}))
         for i in ogsp.objectProcessor(list(e.keys())):
@@ -1,10 +1,13 @@
 from datetime import datetime, timezone, tzinfo
 import hashlib
+import io
 import json
 import unittest
 import unittest.mock
+from enum import Enum
+from types import MappingProxyType
 
-from object_graph_streamer import HashCollector, JsonCollector, JsonProps, objectGraphStreamer, OutState
+from object_graph_streamer import HashCollector, JsonCollector, JsonProps, objectGraphStreamer, ObjectGraphStreamerProps, OutState
 
 
 class Mockdatetime:
@@ -15,6 +18,10 @@ class Mockdatetime:
 mockdatetime = Mockdatetime()
 
 
+class Color(Enum):
+    RED = 1
+
+
 def toSVals(calls: list[unittest.mock.call]):
     return list(map(lambda x: list(map(lambda x: x.to_dict(), x.args)), calls))
 
@@ -267,6 +274,87 @@ class ObjectGraphStreamerTest(unittest.TestCase):
         self.assertEqual(hashCollector.digest(),
                          "CwEMjUHV6BpDS7AGBAYqjY6qMKE6xC8Z56H5T2ZuUuXe")
 
+    def test_sort_with_out_with_generator(self):
+        fn = unittest.mock.Mock()
+        objectGraphStreamer((i for i in [1, 2]), fn)
+        self.assertEqual(toSVals(fn.mock_calls), [
+            [{'outState': "[", 'paths': ['[']}],
+            [{'val': {'val': 1}, 'outState': 'V', 'paths': ['[', '0']}],
+            [{'val': {'val': 2}, 'outState': 'V', 'paths': ['[', '1']}],
+            [{'outState': "]", 'paths': [']']}],
+        ])
+
+    def test_generator_is_consumed_lazily(self):
+        events = []
+
+        def rows():
+            for i in range(3):
+                events.append(f"yield {i}")
+                yield i
+
+        objectGraphStreamer(rows(), lambda o: events.append(
+            o.outState.value[0]))
+        self.assertEqual(events, ["[", "yield 0", "V", "yield 1", "V",
+                                  "yield 2", "V", "]"])
+
+    def test_lazy_arrayProcessor(self):
+        out = []
+        json = JsonCollector(lambda o: out.append(o))
+        objectGraphStreamer(iter(range(6)), lambda o: json.append(o), ObjectGraphStreamerProps(
+            arrayProcessor=lambda a: (i for i in a if i % 2 == 0)))
+        self.assertEqual("".join(out), '[0,2,4]')
+
+    def test_JSONCollector_mapping_of_iterables(self):
+        out = []
+        json = JsonCollector(lambda o: out.append(o))
+        objectGraphStreamer(MappingProxyType({'y': (1, "2"), 'x': range(2), 's': "str"}),
+                            lambda o: json.append(o))
+        self.assertEqual("".join(out), '{"s":"str","x":[0,1],"y":[1,"2"]}')
+
+    def test_sorting_arrayProcessor_on_generator(self):
+        out = []
+        json = JsonCollector(lambda o: out.append(o))
+        objectGraphStreamer((i for i in [3, 1, 2]), lambda o: json.append(o),
+                            ObjectGraphStreamerProps(arrayProcessor=sorted))
+        self.assertEqual("".join(out), '[1,2,3]')
+
+    def test_set_is_not_an_array(self):
+        fn = unittest.mock.Mock()
+        objectGraphStreamer(frozenset([1]), fn)
+        self.assertEqual(toSVals(fn.mock_calls), [
+                         [{'val': {'val': frozenset([1])}, 'outState': 'V', 'paths': []}]])
+
+    def test_HashCollector_tuple_equals_list(self):
+        hash1 = HashCollector()
+        objectGraphStreamer({'t': (1, 2)}, lambda o: hash1.append(o))
+        hash2 = HashCollector()
+        objectGraphStreamer({'t': [1, 2]}, lambda o: hash2.append(o))
+        self.assertEqual(hash1.digest(), hash2.digest())
+
+    def test_in_place_sorting_arrayProcessor_on_list(self):
+        def sorter(a):
+            a.sort()
+            return a
+        out = []
+        json = JsonCollector(lambda o: out.append(o))
+        objectGraphStreamer([3, 1, 2], lambda o: json.append(o),
+                            ObjectGraphStreamerProps(arrayProcessor=sorter))
+        self.assertEqual("".join(out), '[1,2,3]')
+
+    def test_accepted_array_types(self):
+        for arr in ([1, 2], (1, 2), range(1, 3), iter([1, 2]), (i for i in [1, 2])):
+            out = []
+            json = JsonCollector(lambda o: out.append(o))
+            objectGraphStreamer(arr, lambda o: json.append(o))
+            self.assertEqual("".join(out), '[1,2]')
+
+    def test_non_array_iterables_are_values(self):
+        for val in (memoryview(b"ab"), io.StringIO("a\nb"), Color, "ab", b"ab"):
+            fn = unittest.mock.Mock()
+            objectGraphStreamer(val, fn)
+            self.assertEqual(toSVals(fn.mock_calls), [
+                             [{'val': {'val': val}, 'outState': 'V', 'paths': []}]])
+
 
 if __name__ == '__main__':
     unittest.main()